@@ -4,6 +4,10 @@ Constants for Thermomix recipe conversion.
 Keyword dictionaries, unit patterns, and mapping tables used by the converter.
 """
 
+from types import MappingProxyType
+
+import ahocorasick
+
 # ---------------------------------------------------------------------------
 # Keyword-to-Thermomix-parameter mappings for mixing actions
 # ---------------------------------------------------------------------------
@@ -96,12 +100,12 @@ COOKING_KEYWORDS = {
 # ---------------------------------------------------------------------------
 # Keywords that trigger Turbo mode
 # ---------------------------------------------------------------------------
-TURBO_KEYWORDS = {
+TURBO_KEYWORDS = frozenset({
     # French
     "mixer finement", "reduire en poudre", "glace pilee",
     # English
     "crush ice", "grind to powder", "finely blend",
-}
+})
 
 # ---------------------------------------------------------------------------
 # Ingredient unit regex pattern (used by parse_ingredient)
@@ -143,15 +147,15 @@ UNIT_MAP = {
 }
 
 # ---------------------------------------------------------------------------
-# Decimal-to-fraction display mapping
+# Decimal-to-fraction display table (sorted by value)
 # ---------------------------------------------------------------------------
-FRACTION_MAP = {
-    "0.25": "¼",
-    "0.33": "⅓",
-    "0.5": "½",
-    "0.66": "⅔",
-    "0.75": "¾",
-}
+FRACTION_TABLE = (
+    (0.25, "¼"),
+    (1 / 3, "⅓"),
+    (0.5, "½"),
+    (2 / 3, "⅔"),
+    (0.75, "¾"),
+)
 
 # ---------------------------------------------------------------------------
 # Tool detection keywords (keyword list → tool name)
@@ -162,3 +166,41 @@ TOOL_KEYWORDS = {
     "Fouet papillon": ["fouet papillon", "butterfly", "butterfly whisk", "monter en neige", "chantilly", "creme fouettee", "whipped cream", "stiff peaks", "soft peaks"],
     "Panier de cuisson": ["panier de cuisson", "steaming basket", "steam basket"],
 }
+
+# Read-only reverse index {keyword: tool name}
+TOOL_BY_KEYWORD = MappingProxyType({
+    keyword: tool_name
+    for tool_name, keywords in TOOL_KEYWORDS.items()
+    for keyword in keywords
+})
+
+
+# ---------------------------------------------------------------------------
+# Aho-Corasick automaton over all keywords above (one pass per text)
+# ---------------------------------------------------------------------------
+def _build_keyword_automaton() -> ahocorasick.Automaton:
+    """Index every keyword into a single Aho-Corasick automaton.
+
+    Each key maps to a tuple of (category, rank, value) entries, since a
+    keyword may belong to several categories (e.g. "steam"). The rank is the
+    keyword's declaration order, lower meaning higher priority.
+    """
+    entries: dict[str, list[tuple]] = {}
+    for rank, keyword in enumerate(TURBO_KEYWORDS):
+        entries.setdefault(keyword, []).append(("turbo", rank, None))
+    for rank, (keyword, params) in enumerate(COOKING_KEYWORDS.items()):
+        entries.setdefault(keyword, []).append(("cooking", rank, params))
+    for rank, (keyword, params) in enumerate(MIXING_KEYWORDS.items()):
+        entries.setdefault(keyword, []).append(("mixing", rank, params))
+    tool_ranks = {tool_name: rank for rank, tool_name in enumerate(TOOL_KEYWORDS)}
+    for keyword, tool_name in TOOL_BY_KEYWORD.items():
+        entries.setdefault(keyword, []).append(("tool", tool_ranks[tool_name], tool_name))
+
+    automaton = ahocorasick.Automaton()
+    for keyword, values in entries.items():
+        automaton.add_word(keyword, tuple(values))
+    automaton.make_automaton()
+    return automaton
+
+
+KEYWORD_AUTOMATON = _build_keyword_automaton()
@@ -5,15 +5,89 @@ Based on the unofficial reverse-engineered API from the Cookidoo Android app.
 """
 
 import os
+import json
+import time
 import asyncio
+from dataclasses import asdict
+from functools import lru_cache
+from pathlib import Path
 from typing import Optional
 
 from aiohttp import ClientSession, TCPConnector
-from cookidoo_api import Cookidoo, CookidooConfig
+from cookidoo_api import Cookidoo, CookidooAuthException, CookidooConfig
 from cookidoo_api.helpers import get_localization_options
 
+try:
+    from cookidoo_api import CookidooAuthData
+except ImportError:  # older cookidoo-api: no public token restore, always log in
+    CookidooAuthData = None
+
 from .models import ThermomixRecipe
 
+# Backoff delays (seconds) between update attempts while a newly created
+# recipe is not yet visible to the update endpoint (404/409)
+_PROPAGATION_DELAYS = (0.1, 0.2, 0.4, 0.8, 1.6)
+
+_JSON_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+}
+
+# Access tokens are persisted here so a restarted server skips the login
+_TOKEN_CACHE_FILE = "token.json"
+
+# Restored tokens this close to expiry (seconds) are refreshed before use
+_TOKEN_EXPIRY_MARGIN = 300
+
+# Whether the installed cookidoo-api can restore persisted tokens
+_CAN_RESTORE_TOKENS = (
+    CookidooAuthData is not None
+    and hasattr(Cookidoo, "apply_auth_data")
+    and hasattr(Cookidoo, "refresh")
+)
+
+
+def _token_cache_path() -> Path:
+    """Return the token cache file, under $XDG_CACHE_HOME (or ~/.cache)."""
+    cache_home = os.getenv("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(cache_home) / "mcp-cookidoo-thermomix" / _TOKEN_CACHE_FILE
+
+
+def _load_cached_token(email: str, country: str) -> Optional["CookidooAuthData"]:
+    """Load the tokens saved for this account, if any.
+
+    Args:
+        email: The account the tokens must belong to.
+        country: The Cookidoo country the tokens were issued for.
+
+    Returns:
+        The cached auth data, or None if missing or unreadable.
+    """
+    try:
+        cached = json.loads(_token_cache_path().read_text(encoding="utf-8"))
+        if cached["email"] != email or cached["country"] != country:
+            return None
+        return CookidooAuthData(**cached["auth_data"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def _save_cached_token(email: str, country: str, auth_data: "CookidooAuthData") -> None:
+    """Persist the auth data (owner-only file); failures are not fatal."""
+    path = _token_cache_path()
+    try:
+        payload = {
+            "email": email,
+            "country": country,
+            "auth_data": asdict(auth_data),
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump(payload, f)
+    except (OSError, TypeError):
+        pass
+
 
 def load_credentials() -> tuple[str, str]:
     """Load Cookidoo credentials from environment variables.
@@ -31,9 +105,12 @@ def load_credentials() -> tuple[str, str]:
     return email, password
 
 
+@lru_cache(maxsize=1)
 def load_locale() -> tuple[str, str]:
     """Load Cookidoo locale settings from environment variables.
 
+    The environment is read once per process; the result is cached.
+
     Returns:
         A tuple (country, language) e.g. ("fr", "fr-FR").
     """
@@ -52,9 +129,30 @@ class CookidooClient:
         self.language = language
         self._api: Optional[Cookidoo] = None
         self._session: Optional[ClientSession] = None
+        # Derived from the localization once at login, reused by every upload
+        self._base_url: Optional[str] = None
+        self._recipe_locale: Optional[str] = None
+        self._site_url: Optional[str] = None
+
+    async def login(self, use_cached_token: bool = True) -> None:
+        """Authenticate with Cookidoo and initialize the API client.
+
+        When the installed cookidoo-api supports it, tokens are persisted
+        after every login or refresh and restored on the next start.
+
+        Args:
+            use_cached_token: Restore the tokens saved by a previous login
+                instead of logging in again. Ignored once the API client
+                exists: a re-login always requests new tokens.
+        """
+        if self._api is not None:
+            # Re-login (e.g. after a rejected token): keep the API client
+            await self._api.login()
+            return
 
-    async def login(self) -> None:
-        """Authenticate with Cookidoo and initialize the API client."""
+        if self._session:
+            # Left over from a failed attempt
+            await self._session.close()
         self._session = ClientSession(connector=TCPConnector(ssl=False))
         localization_options = await get_localization_options(
             country=self.country, language=self.language
@@ -64,8 +162,45 @@ class CookidooClient:
             password=self.password,
             localization=localization_options[0],
         )
-        self._api = Cookidoo(session=self._session, cfg=config)
-        await self._api.login()
+        api = Cookidoo(session=self._session, cfg=config)
+        if _CAN_RESTORE_TOKENS:
+            # Also stores the refresh tokens the server rotates
+            api.on_auth_data_update = self._store_auth_data
+            cached_token = (
+                _load_cached_token(self.email, self.country) if use_cached_token else None
+            )
+            if cached_token is not None:
+                await self._restore_auth_data(api, cached_token)
+            else:
+                await api.login()
+        else:
+            await api.login()
+        self._api = api
+
+        localization = self._api.localization
+        url_parts = localization.url.split("/")
+        self._base_url = f"{url_parts[0]}//{url_parts[2]}"
+        self._recipe_locale = localization.language
+        self._site_url = localization.url
+
+    def _store_auth_data(self, auth_data: "CookidooAuthData") -> None:
+        """Persist new tokens (on_auth_data_update callback)."""
+        _save_cached_token(self.email, self.country, auth_data)
+
+    @staticmethod
+    async def _restore_auth_data(api: Cookidoo, auth_data: "CookidooAuthData") -> None:
+        """Restore persisted tokens, refreshing or logging in if they are stale.
+
+        Uploads send the access token directly, bypassing the library's
+        automatic refresh, so an expiring token is refreshed here.
+        """
+        api.apply_auth_data(auth_data)
+        if auth_data.expires_at - _TOKEN_EXPIRY_MARGIN > time.time():
+            return
+        try:
+            await api.refresh()
+        except CookidooAuthException:
+            await api.login()
 
     async def close(self) -> None:
         """Close the HTTP session."""
@@ -84,6 +219,10 @@ class CookidooClient:
 
         Returns:
             A dict with "recipe_id" and "url" of the created recipe.
+
+        Raises:
+            CookidooAuthException: If the access token was rejected; call
+                login(use_cached_token=False) and retry.
         """
         if not self._api:
             raise RuntimeError("Not connected. Call login() first.")
@@ -92,16 +231,9 @@ class CookidooClient:
         if not auth_data:
             raise RuntimeError("No authentication data available.")
 
-        localization = self._api.localization
-        url_parts = localization.url.split("/")
-        base_url = f"{url_parts[0]}//{url_parts[2]}"
-        locale = localization.language
-
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            "Authorization": f"Bearer {auth_data.access_token}",
-        }
+        base_url = self._base_url
+        locale = self._recipe_locale
+        headers = {**_JSON_HEADERS, "Authorization": f"Bearer {auth_data.access_token}"}
 
         api_session = self._api._session
 
@@ -110,6 +242,8 @@ class CookidooClient:
         async with api_session.post(
             create_url, json={"recipeName": recipe.name}, headers=headers
         ) as response:
+            if response.status == 401:
+                raise CookidooAuthException("Access token rejected by Cookidoo")
             if response.status != 200:
                 error_text = await response.text()
                 raise RuntimeError(
@@ -120,21 +254,23 @@ class CookidooClient:
             if not recipe_id:
                 raise RuntimeError("No recipeId returned by the API")
 
-        # Short delay to let the backend propagate
-        await asyncio.sleep(3)
-
-        # Step 2: Update with full content
+        # Step 2: Update with full content, retrying with backoff while the
+        # backend has not propagated the new recipe yet
         update_url = f"{base_url}/created-recipes/{locale}/{recipe_id}"
         payload = recipe.to_cookidoo_payload(locale)
 
-        async with api_session.patch(
-            update_url, json=payload, headers=headers
-        ) as response:
-            if response.status not in (200, 204):
-                error_text = await response.text()
-                raise RuntimeError(
-                    f"Recipe update failed (status {response.status}): {error_text}"
-                )
+        for delay in (*_PROPAGATION_DELAYS, None):
+            async with api_session.patch(
+                update_url, json=payload, headers=headers
+            ) as response:
+                if response.status in (200, 204):
+                    break
+                if delay is None or response.status not in (404, 409):
+                    error_text = await response.text()
+                    raise RuntimeError(
+                        f"Recipe update failed (status {response.status}): {error_text}"
+                    )
+            await asyncio.sleep(delay)
 
-        recipe_url = f"https://{localization.url}/recipes/custom-recipes/{recipe_id}"
+        recipe_url = f"https://{self._site_url}/recipes/custom-recipes/{recipe_id}"
         return {"recipe_id": recipe_id, "url": recipe_url}
@@ -6,13 +6,58 @@ Supports Cookidoo structured annotations for:
 - INGREDIENT links between steps and ingredients
 """
 
-from pydantic import BaseModel, Field
-from typing import Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import NamedTuple, Optional, Self
 
+# Initial letters taking the elided "d'" article in French
+_FR_VOWELS = frozenset("aeiouyàâéèêëïîôùûü")
 
-class Ingredient(BaseModel):
+# Speed labels in TTS text
+_SPEED_FR = "vitesse"
+_SPEED_EN = "speed"
+
+
+def _format_duration(seconds: int | None) -> str | None:
+    """Format a duration as TTS text (e.g. "2 min", "1 min 30 sec", "45 sec")."""
+    if not seconds:
+        return None
+    minutes, secs = divmod(seconds, 60)
+    if not minutes:
+        return f"{secs} sec"
+    return f"{minutes} min {secs} sec" if secs else f"{minutes} min"
+
+
+class _RenderCachedModel(BaseModel):
+    """Base for frozen models memoizing their rendered texts per locale.
+
+    Subclasses are frozen, so the texts stay valid; model_copy(update=...)
+    gives the copy an empty cache. The cache is not part of the model's
+    value: equality compares fields only.
+    """
+
+    _render_cache: dict = PrivateAttr(default_factory=dict)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        return (
+            type(self) is type(other)
+            and self.__dict__ == other.__dict__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+    def model_copy(self, *, update: dict | None = None, deep: bool = False) -> Self:
+        """Copy the model with an empty render cache (see BaseModel.model_copy)."""
+        copied = super().model_copy(update=update, deep=deep)
+        copied._render_cache = {}
+        return copied
+
+
+class Ingredient(_RenderCachedModel):
     """An ingredient with optional quantity."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     name: str
     quantity: Optional[str] = None
     unit: Optional[str] = None
@@ -33,11 +78,21 @@ class Ingredient(BaseModel):
             FR: "200 g de boulgour" or "20 g d'huile d'olive".
             EN: "200 g flour" or "1 tbsp olive oil".
         """
-        name = self.name[0].lower() + self.name[1:] if self.name else self.name
+        key = ("text", locale)
+        text = self._render_cache.get(key)
+        if text is None:
+            text = self._render_cache[key] = self._build_text(locale.startswith("fr"))
+        return text
+
+    def _build_text(self, is_fr: bool) -> str:
+        """Build the uncached ingredient text (see to_text)."""
+        name = self.name
+        # Scraped names are usually lowercase already: skip the copy then
+        if name and not name[0].islower():
+            name = name[0].lower() + name[1:]
         if self.quantity and self.unit:
-            if locale.startswith("fr"):
-                vowels = "aeiouyàâéèêëïîôùûüAEIOUY"
-                if name and name[0] in vowels:
+            if is_fr:
+                if name[:1] in _FR_VOWELS:
                     return f"{self.quantity} {self.unit} d'{name}"
                 return f"{self.quantity} {self.unit} de {name}"
             return f"{self.quantity} {self.unit} {name}"
@@ -61,11 +116,14 @@ class Ingredient(BaseModel):
         return data
 
 
-class AnnotationPosition(BaseModel):
-    """Position of an annotation within step text."""
+class AnnotationPosition(NamedTuple):
+    """Position of an annotation within step text.
 
-    offset: int = Field(..., description="Character offset from start of step text")
-    length: int = Field(..., description="Length of the annotated text")
+    A plain tuple rather than a model: one is created per annotation.
+    """
+
+    offset: int  # Character offset from start of step text
+    length: int  # Length of the annotated text
 
 
 class TTSAnnotation(BaseModel):
@@ -74,6 +132,8 @@ class TTSAnnotation(BaseModel):
     Maps to Cookidoo's {"type": "TTS"} annotation format.
     """
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     position: AnnotationPosition
     speed: Optional[str] = Field(None, description="Speed value as string (1-10)")
     time: Optional[int] = Field(None, description="Duration in seconds")
@@ -96,10 +156,7 @@ class TTSAnnotation(BaseModel):
             }
         return {
             "type": "TTS",
-            "position": {
-                "offset": self.position.offset,
-                "length": self.position.length,
-            },
+            "position": self.position._asdict(),
             "data": data,
         }
 
@@ -117,10 +174,7 @@ class IngredientAnnotation(BaseModel):
         """Convert to Cookidoo API annotation format."""
         return {
             "type": "INGREDIENT",
-            "position": {
-                "offset": self.position.offset,
-                "length": self.position.length,
-            },
+            "position": self.position._asdict(),
             "data": {
                 "description": {
                     "text": self.ingredient.to_text(locale),
@@ -130,9 +184,11 @@ class IngredientAnnotation(BaseModel):
         }
 
 
-class ThermomixStep(BaseModel):
+class ThermomixStep(_RenderCachedModel):
     """A recipe step in Thermomix format."""
 
+    model_config = ConfigDict(frozen=True, extra="forbid")
+
     description: str
     duration_seconds: Optional[int] = Field(None, description="Duration in seconds")
     temperature: Optional[int] = Field(None, description="Temperature in °C (37-120)")
@@ -154,26 +210,24 @@ class ThermomixStep(BaseModel):
             A string like "30 sec/vitesse 3" or "5 min/100°C/vitesse 1",
             or None if no cooking parameters.
         """
-        details = []
-        if self.duration_seconds:
-            minutes, secs = divmod(self.duration_seconds, 60)
-            if minutes > 0:
-                time_str = f"{minutes} min"
-                if secs:
-                    time_str += f" {secs} sec"
-                details.append(time_str)
-            else:
-                details.append(f"{secs} sec")
+        key = ("tts", locale)
+        if key not in self._render_cache:
+            self._render_cache[key] = self._build_tts_text(locale)
+        return self._render_cache[key]
+
+    def _build_tts_text(self, locale: str) -> str | None:
+        """Build the uncached TTS text (see tts_text)."""
+        speed_label = _SPEED_FR if locale.startswith("fr") else _SPEED_EN
         if self.is_varoma:
-            details.append("Varoma")
-        elif self.temperature:
-            details.append(f"{self.temperature}°C")
+            temperature = "Varoma"
+        else:
+            temperature = f"{self.temperature}°C" if self.temperature else None
         if self.is_turbo:
-            details.append("Turbo")
-        elif self.speed:
-            speed_label = "vitesse" if locale.startswith("fr") else "speed"
-            details.append(f"{speed_label} {self.speed}")
-        return "/".join(details) if details else None
+            speed = "Turbo"
+        else:
+            speed = f"{speed_label} {self.speed}" if self.speed else None
+        parts = (_format_duration(self.duration_seconds), temperature, speed)
+        return "/".join(part for part in parts if part) or None
 
     def to_text(self, locale: str = "fr") -> str:
         """Format the step as Cookidoo step text.
@@ -181,22 +235,34 @@ class ThermomixStep(BaseModel):
         Returns:
             A string like "Mix ingredients 5 min/100°C/vitesse 1".
         """
-        tts = self.tts_text(locale)
-        if tts:
-            return f"{self.description} {tts}"
-        return self.description
+        key = ("text", locale)
+        text = self._render_cache.get(key)
+        if text is None:
+            tts = self.tts_text(locale)
+            text = f"{self.description} {tts}" if tts else self.description
+            self._render_cache[key] = text
+        return text
+
+    def with_ingredient_annotations(
+        self, annotations: list[IngredientAnnotation]
+    ) -> "ThermomixStep":
+        """Return a copy linked to its ingredients, keeping rendered texts.
+
+        Ingredient annotations don't affect the step or TTS text, so the
+        renderings cached while locating the mentions remain valid.
+        """
+        copied = self.model_copy(update={"ingredient_annotations": annotations})
+        copied._render_cache.update(self._render_cache)
+        return copied
 
     def build_annotations(self, locale: str = "fr") -> list[dict]:
         """Build all Cookidoo annotations for this step.
 
         Combines INGREDIENT and TTS annotations.
         """
-        annotations = []
-        for ing in self.ingredient_annotations:
-            annotations.append(ing.to_cookidoo_annotation(locale))
-        for tts in self.tts_annotations:
-            annotations.append(tts.to_cookidoo_annotation())
-        return annotations
+        return [
+            ing.to_cookidoo_annotation(locale) for ing in self.ingredient_annotations
+        ] + [tts.to_cookidoo_annotation() for tts in self.tts_annotations]
 
 
 class ScrapedRecipe(BaseModel):
@@ -238,16 +304,18 @@ class ThermomixRecipe(BaseModel):
         """
         lang = self.locale
         unit_text = "portion" if lang.startswith("fr") else "serving"
+        # Rendered first so the steps' ingredient annotations hit the cache
+        ingredient_texts = [ing.to_text(lang) for ing in self.ingredients]
 
-        instructions = []
-        for step in self.steps:
-            step_dict: dict = {
+        instructions = [
+            {
                 "type": "STEP",
                 "text": step.to_text(lang),
                 "annotations": step.build_annotations(lang),
                 "missedUsages": [],
             }
-            instructions.append(step_dict)
+            for step in self.steps
+        ]
 
         return {
             "name": self.name,
@@ -258,8 +326,8 @@ class ThermomixRecipe(BaseModel):
             "cookTime": 0,
             "totalTime": self.total_time_minutes * 60,
             "ingredients": [
-                {"type": "INGREDIENT", "text": ing.to_text(lang)}
-                for ing in self.ingredients
+                {"type": "INGREDIENT", "text": text}
+                for text in ingredient_texts
             ],
             "instructions": instructions,
             "hints": "\n".join(self.hints) if self.hints else "",
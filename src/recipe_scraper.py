@@ -2,12 +2,63 @@
 Recipe scraping from any website.
 Uses recipe-scrapers (200+ supported sites) with fallback to raw HTML parsing.
 """
+import asyncio
 import re
 import aiohttp
 from typing import Optional
 from recipe_scrapers import scrape_html
 from .models import ScrapedRecipe
 
+# Step headers scraped as standalone lines ("Etape 1", "Step 3:", ...)
+_STEP_HEADER_RE = re.compile(
+    r"^(?:étape|etape|step|fase|schritt|paso)\s*\d+\s*[:.>)\-]?\s*$",
+    re.IGNORECASE,
+)
+
+# First integer in a yields string ("4 servings", "6 personnes")
+_SERVINGS_RE = re.compile(r"(\d+)")
+
+
+_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0.0.0 Safari/537.36"
+    )
+}
+
+# Shared HTTP session, so keep-alive connections are reused across fetches
+_session: Optional[aiohttp.ClientSession] = None
+# Event loop the shared session is bound to
+_session_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+async def _get_session() -> aiohttp.ClientSession:
+    """Return the shared HTTP session, creating it on first use.
+
+    A session only works on the event loop that created it, so a new one is
+    made when called from another loop (e.g. successive asyncio.run calls).
+    """
+    global _session, _session_loop
+    loop = asyncio.get_running_loop()
+    if _session is None or _session.closed or _session_loop is not loop:
+        _session_loop = loop
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(ssl=False, limit=20, ttl_dns_cache=300),
+            headers=_HEADERS,
+            timeout=aiohttp.ClientTimeout(total=30),
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared HTTP session used by fetch_html."""
+    global _session, _session_loop
+    if _session is not None and _session_loop is asyncio.get_running_loop():
+        await _session.close()
+    _session = None
+    _session_loop = None
+
 
 async def fetch_html(url: str) -> str:
     """Fetch the HTML content of a web page.
@@ -16,19 +67,13 @@ async def fetch_html(url: str) -> str:
         url: The URL to fetch.
 
     Returns:
-        The raw HTML string.
+        The raw HTML string. aiohttp picks the charset (falling back when
+        the declared one is unknown); undecodable bytes are replaced.
     """
-    headers = {
-        "User-Agent": (
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
-            "AppleWebKit/537.36 (KHTML, like Gecko) "
-            "Chrome/120.0.0.0 Safari/537.36"
-        )
-    }
-    async with aiohttp.ClientSession(connector=aiohttp.TCPConnector(ssl=False)) as session:
-        async with session.get(url, headers=headers, timeout=aiohttp.ClientTimeout(total=30)) as resp:
-            resp.raise_for_status()
-            return await resp.text()
+    session = await _get_session()
+    async with session.get(url) as resp:
+        resp.raise_for_status()
+        return await resp.text(errors="replace")
 
 
 def _parse_time(time_str: Optional[str | int]) -> Optional[int]:
@@ -40,23 +85,31 @@ def _parse_time(time_str: Optional[str | int]) -> Optional[int]:
     Returns:
         The time in minutes, or None if parsing fails.
     """
-    if time_str is None:
-        return None
-    if isinstance(time_str, (int, float)):
-        return int(time_str)
     try:
-        return int(time_str)
+        return None if time_str is None else int(time_str)
     except (ValueError, TypeError):
         return None
 
 
 def _is_step_header(text: str) -> bool:
     """Check if a line is just a step header like 'Etape 1', 'Step 3', etc."""
-    return bool(re.match(
-        r"^(?:étape|etape|step|fase|schritt|paso)\s*\d+\s*[:.>)\-]?\s*$",
-        text,
-        re.IGNORECASE,
-    ))
+    return bool(_STEP_HEADER_RE.match(text))
+
+
+def _safe_call(func, default):
+    """Call a scraper method safely, returning a default on failure.
+
+    Args:
+        func: A bound scraper method (e.g. scraper.title).
+        default: The fallback value if the call fails or returns nothing.
+
+    Returns:
+        The result of the call, or the default value.
+    """
+    try:
+        return func() or default
+    except Exception:
+        return default
 
 
 async def scrape_recipe(url: str) -> ScrapedRecipe:
@@ -89,7 +142,7 @@ async def scrape_recipe(url: str) -> ScrapedRecipe:
     try:
         servings_raw = scraper.yields()
         if servings_raw:
-            match = re.search(r"(\d+)", str(servings_raw))
+            match = _SERVINGS_RE.search(str(servings_raw))
             if match:
                 servings = int(match.group(1))
     except Exception:
@@ -123,21 +176,25 @@ async def scrape_recipe(url: str) -> ScrapedRecipe:
     )
 
 
-def _safe_call(func_or_val, default):
-    """Call a scraper method safely, returning a default on failure.
+async def scrape_recipes(
+    urls: list[str], concurrency: int = 8
+) -> list[ScrapedRecipe | BaseException]:
+    """Scrape several recipes concurrently over the shared HTTP session.
 
     Args:
-        func_or_val: A callable or a value to evaluate.
-        default: The fallback value if the call fails.
+        urls: The recipe page URLs.
+        concurrency: Maximum number of pages fetched at the same time.
 
     Returns:
-        The result of the call, or the default value.
+        One entry per URL, in order: the ScrapedRecipe, or the exception
+        raised while scraping it.
     """
-    try:
-        if callable(func_or_val):
-            result = func_or_val()
-        else:
-            result = func_or_val
-        return result if result else default
-    except Exception:
-        return default
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def _scrape_one(url: str) -> ScrapedRecipe:
+        async with semaphore:
+            return await scrape_recipe(url)
+
+    return await asyncio.gather(
+        *(_scrape_one(url) for url in urls), return_exceptions=True
+    )
@@ -3,14 +3,32 @@ MCP Server Cookidoo Thermomix
 
 A single tool to import any recipe link into Cookidoo as a Thermomix recipe.
 """
+import asyncio
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator
+
+import anyio
+from cookidoo_api import CookidooAuthException
 from fastmcp import FastMCP
 from .cookidoo_service import CookidooClient, load_credentials, load_locale
-from .recipe_scraper import scrape_recipe
+from .recipe_scraper import close_session, scrape_recipe
 from .thermomix_converter import convert_recipe
 from .models import ThermomixRecipe
 
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[None]:
+    """Close the shared scraping session when the server shuts down."""
+    try:
+        yield
+    finally:
+        await close_session()
+
+
 mcp = FastMCP(
     "cookidoo-thermomix",
+    lifespan=_lifespan,
     instructions=(
         "This server lets you import any recipe from a web link "
         "and automatically convert it into a Thermomix recipe on your Cookidoo account. "
@@ -36,6 +54,14 @@ mcp = FastMCP(
 # Global Cookidoo client state
 _client: CookidooClient | None = None
 
+
+@lru_cache(maxsize=1)
+def _content_locale() -> str:
+    """Return the short content locale, e.g. "fr-FR" -> "fr"."""
+    _, language = load_locale()
+    return language.split("-")[0]
+
+
 @mcp.tool()
 async def import_recipe(url: str) -> str:
     """Import a recipe from a web link and save it to Cookidoo.
@@ -75,14 +101,17 @@ async def import_recipe(url: str) -> str:
             "Make sure the link is correct and the site is accessible."
         )
 
-    # 3. Convert to Thermomix format
-    _, language = load_locale()
-    locale = language.split("-")[0]  # "fr-FR" -> "fr"
-    thermomix_recipe = convert_recipe(scraped, locale=locale)
+    # 3. Convert to Thermomix format (CPU-bound, keep it off the event loop)
+    locale = _content_locale()
+    thermomix_recipe = await asyncio.to_thread(convert_recipe, scraped, locale=locale)
 
-    # 4. Upload to Cookidoo
+    # 4. Upload to Cookidoo (logging in again if a cached token was rejected)
     try:
-        result = await _client.upload_recipe(thermomix_recipe)
+        try:
+            result = await _client.upload_recipe(thermomix_recipe)
+        except CookidooAuthException:
+            await _client.login(use_cached_token=False)
+            result = await _client.upload_recipe(thermomix_recipe)
     except Exception as e:
         return (
             f"Unable to save the recipe on Cookidoo: {e}\n\n"
@@ -91,10 +120,10 @@ async def import_recipe(url: str) -> str:
         )
 
     # 5. Summary for the user
-    steps_preview = "\n".join(
+    steps_preview = "\n".join([
         f"  {i+1}. {step.to_text(locale)}"
         for i, step in enumerate(thermomix_recipe.steps[:5])
-    )
+    ])
     if len(thermomix_recipe.steps) > 5:
         steps_preview += f"\n  ... and {len(thermomix_recipe.steps) - 5} more steps"
 
@@ -126,19 +155,18 @@ async def preview_recipe(url: str) -> str:
         return f"Unable to read the recipe from {url}\nError: {e}"
 
     # 2. Convert
-    _, language = load_locale()
-    locale = language.split("-")[0]  # "fr-FR" -> "fr"
-    thermomix_recipe = convert_recipe(scraped, locale=locale)
+    locale = _content_locale()
+    thermomix_recipe = await asyncio.to_thread(convert_recipe, scraped, locale=locale)
 
     # 3. Display preview
-    ingredients_text = "\n".join(
+    ingredients_text = "\n".join([
         f"  • {ing.to_text(locale)}" for ing in thermomix_recipe.ingredients
-    )
-    steps_text = "\n".join(
+    ])
+    steps_text = "\n".join([
         f"  {i+1}. {step.to_text(locale)}"
         for i, step in enumerate(thermomix_recipe.steps)
-    )
-    hints_text = "\n".join(f"  - {h}" for h in thermomix_recipe.hints)
+    ])
+    hints_text = "\n".join([f"  - {h}" for h in thermomix_recipe.hints])
 
     return (
         f"{thermomix_recipe.name}\n"
@@ -152,8 +180,17 @@ async def preview_recipe(url: str) -> str:
 
 
 def main():
-    """Entry point to start the MCP server."""
-    mcp.run()
+    """Entry point to start the MCP server.
+
+    Runs on uvloop when it is installed (the "fast" extra), otherwise on the
+    default asyncio event loop.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        mcp.run()
+    else:
+        anyio.run(mcp.run_async, backend_options={"loop_factory": uvloop.new_event_loop})
 
 
 if __name__ == "__main__":
@@ -5,11 +5,14 @@ Supports French and English UI.
 
 import getpass
 import json
-import platform
-import shutil
 import sys
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # optional, the stdlib json module is used instead
+    orjson = None
+
 # ---------------------------------------------------------------------------
 # i18n — all user-facing strings
 # ---------------------------------------------------------------------------
@@ -98,7 +101,23 @@ LOCALE_OPTIONS = {
 SERVER_KEY = "cookidoo-thermomix"
 
 
+def _loads(text: str) -> dict:
+    """Parse the config file contents."""
+    if orjson is not None:
+        return orjson.loads(text)
+    return json.loads(text)
+
+
+def _dumps(data: dict) -> str:
+    """Serialize the config as 2-space indented JSON, with a final newline."""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode() + "\n"
+    return json.dumps(data, indent=2, ensure_ascii=False) + "\n"
+
+
 def _get_config_path() -> Path:
+    import platform
+
     system = platform.system()
     if system == "Darwin":
         return Path.home() / "Library" / "Application Support" / "Claude" / "claude_desktop_config.json"
@@ -109,6 +128,8 @@ def _get_config_path() -> Path:
 
 
 def _find_binary() -> str | None:
+    import shutil
+
     return shutil.which("mcp-cookidoo-thermomix")
 
 
@@ -149,7 +170,7 @@ def main() -> None:
     existing = {}
     if config_path.exists():
         try:
-            existing = json.loads(config_path.read_text(encoding="utf-8"))
+            existing = _loads(config_path.read_text(encoding="utf-8"))
         except (json.JSONDecodeError, OSError):
             existing = {}
 
@@ -174,7 +195,7 @@ def main() -> None:
             srv["env"]["COOKIDOO_EMAIL"] = email
             srv["env"]["COOKIDOO_PASSWORD"] = password
             config_path.write_text(
-                json.dumps(existing, indent=2, ensure_ascii=False) + "\n",
+                _dumps(existing),
                 encoding="utf-8",
             )
             print(f"\n{t['creds_updated']}")
@@ -250,7 +271,7 @@ def main() -> None:
     # 8. Write config
     config_path.parent.mkdir(parents=True, exist_ok=True)
     config_path.write_text(
-        json.dumps(existing, indent=2, ensure_ascii=False) + "\n",
+        _dumps(existing),
         encoding="utf-8",
     )
 
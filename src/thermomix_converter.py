@@ -10,6 +10,11 @@ Transforms cooking steps into Thermomix instructions with:
 
 import re
 import unicodedata
+from bisect import bisect_left
+from functools import lru_cache
+from typing import NamedTuple
+
+import ahocorasick
 
 from .models import (
     Ingredient,
@@ -21,20 +26,35 @@ from .models import (
     IngredientAnnotation,
 )
 from .constants import (
-    MIXING_KEYWORDS,
-    COOKING_KEYWORDS,
-    TURBO_KEYWORDS,
     UNITS_PATTERN,
     UNIT_MAP,
-    FRACTION_MAP,
+    FRACTION_TABLE,
     TOOL_KEYWORDS,
+    KEYWORD_AUTOMATON,
 )
 
 
+class _CombiningMarkTable(dict):
+    """str.translate table deleting combining marks (Unicode category Mn).
+
+    Filled lazily: each code point is classified the first time it is seen,
+    instead of scanning the whole Unicode range at import.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        mapped = None if unicodedata.category(chr(codepoint)) == "Mn" else codepoint
+        self[codepoint] = mapped
+        return mapped
+
+
+_COMBINING_MARKS = _CombiningMarkTable()
+
+
 def _strip_accents(text: str) -> str:
     """Remove diacritics/accents from text (e.g. 'émincer' -> 'emincer')."""
-    nfkd = unicodedata.normalize("NFKD", text)
-    return "".join(c for c in nfkd if unicodedata.category(c) != "Mn")
+    if text.isascii():
+        return text
+    return unicodedata.normalize("NFKD", text).translate(_COMBINING_MARKS)
 
 
 # Matches TTS patterns: "5 sec/vitesse 5", "2 min/120°C/vitesse 1", "100°C/speed 1"
@@ -53,86 +73,93 @@ _OLD_TTS_RE = re.compile(
     re.IGNORECASE,
 )
 
-
-def _clean_description(text: str) -> str:
-    """Clean step description: strip TTS params and normalize wording."""
-    text = _OLD_TTS_RE.sub(" ", text)
-    text = _TTS_TEXT_RE.sub(" ", text)
+# Thermomix wording rewrites, in a single scan
+_CLEAN_RE = re.compile(
     # "dans le Thermomix" / "au Thermomix" → "dans le bol"
-    text = re.sub(r"(?:dans|au)\s+(?:le\s+)?thermomix", "dans le bol", text, flags=re.IGNORECASE)
+    r"(?P<in_thermomix>(?:dans|au)\s+(?:le\s+)?thermomix)"
     # "la spatule du Thermomix" → "la spatule"
-    text = re.sub(r"du\s+thermomix", "", text, flags=re.IGNORECASE)
-    text = re.sub(r"\s+", " ", text).strip()
-    text = re.sub(r"\.\s*\.$", ".", text)
-    return text
-
-
-def _parse_speed_from_text(text: str) -> int | None:
-    """Extract a Thermomix speed from free text (e.g. 'vitesse 5')."""
-    match = re.search(r"(?:vitesse|speed)\s*([\d.]+)", text, re.IGNORECASE)
-    if match:
-        return max(1, round(float(match.group(1))))
-    return None
+    r"|(?P<du_thermomix>du\s+thermomix)",
+    re.IGNORECASE,
+)
 
+_CLEAN_REPLACEMENTS = {
+    "in_thermomix": "dans le bol",
+    "du_thermomix": "",
+}
 
-def _parse_duration_from_text(text: str) -> int | None:
-    """Extract a duration in seconds from free text.
+_DOUBLE_DOT_RE = re.compile(r"\.\s*\.$")
 
-    Args:
-        text: The text to parse (e.g. "cuire 30 minutes").
 
-    Returns:
-        The duration in seconds, or None if not found.
-    """
-    text_lower = text.lower()
+def _clean_replacement(match: re.Match) -> str:
+    """Return the replacement for a _CLEAN_RE match."""
+    return _CLEAN_REPLACEMENTS[match.lastgroup]
 
-    # "30 minutes", "10 min"
-    match = re.search(r"(\d+)\s*(?:minutes?|min)", text_lower)
-    if match:
-        return int(match.group(1)) * 60
 
-    # "30 secondes", "10 sec", "10 s", "30 seconds"
-    match = re.search(r"(\d+)\s*(?:secondes?|seconds?|sec|s\b)", text_lower)
-    if match:
-        return int(match.group(1))
+def _clean_description(text: str) -> str:
+    """Clean step description: strip TTS params and normalize wording."""
+    text = _OLD_TTS_RE.sub(" ", text)
+    text = _TTS_TEXT_RE.sub(" ", text)
+    text = _CLEAN_RE.sub(_clean_replacement, text)
+    text = " ".join(text.split())
+    text = _DOUBLE_DOT_RE.sub(".", text)
+    return text
 
-    # "1h30", "1 heure 30", "1 hour 30"
-    match = re.search(r"(\d+)\s*(?:h(?:eures?|ours?)?)\s*(\d+)?", text_lower)
-    if match:
-        hours = int(match.group(1))
-        minutes = int(match.group(2)) if match.group(2) else 0
-        return (hours * 60 + minutes) * 60
 
-    return None
+# Explicit step parameters, found in one scan. Only the number (or keyword)
+# is consumed and units sit in lookaheads, so overlapping mentions such as
+# "1h30 min" or "speed 5 min" still report every parameter.
+_STEP_PARAMS_RE = re.compile(
+    r"(?P<num>\d+)(?=\s*(?:"
+    r"(?P<temp>°)"
+    r"|(?P<min>minutes?|min)"
+    r"|(?P<sec>secondes?|seconds?|sec|s\b)"
+    r"|(?P<hr>h(?:(?=(?:eures?|ours?)?\s*(?P<hr_min>\d+)))?)"
+    r"))"
+    r"|(?:vitesse|speed)(?=\s*(?P<speed>[\d.]+))"
+    r"|\b(?P<varoma>varoma)\b",
+    re.IGNORECASE,
+)
 
 
-def _parse_temperature_from_text(text: str) -> int | None:
-    """Extract a temperature in °C from free text.
+def _parse_step_params(
+    text: str,
+) -> tuple[int | None, int | None, int | None, bool]:
+    """Extract explicit cooking parameters from free text in a single pass.
 
     Args:
-        text: The text to parse (e.g. "cuire à 180°C").
+        text: The text to parse (e.g. "cuire 30 minutes à 100°C vitesse 1").
 
     Returns:
-        The temperature clamped to 37-120°C, or None if not found.
+        A tuple (temperature, duration, speed, is_varoma): the temperature in
+        °C clamped to 37-120, the duration in seconds (minutes win over
+        seconds, which win over hours), the speed, and whether Varoma is
+        referenced. Values not found are None.
     """
-    match = re.search(r"(\d+)\s*°\s*[Cc]?", text)
-    if match:
-        temp = int(match.group(1))
-        # Thermomix caps at 120°C
-        return min(temp, 120) if temp >= 37 else None
-    return None
+    # Keep the first match of each kind, like separate re.search calls would
+    matches = list(_STEP_PARAMS_RE.finditer(text))
+    first = {match.lastgroup: match for match in reversed(matches)}
 
+    temperature = None
+    if "temp" in first:
+        temp = int(first["temp"].group("num"))
+        # Thermomix caps at 120°C
+        temperature = min(temp, 120) if temp >= 37 else None
 
-def _is_varoma_temperature(text: str) -> bool:
-    """Check if the text references Varoma temperature.
+    duration = None
+    if "min" in first:
+        duration = int(first["min"].group("num")) * 60
+    elif "sec" in first:
+        duration = int(first["sec"].group("num"))
+    elif "hr" in first:
+        match = first["hr"]
+        minutes = int(match.group("hr_min")) if match.group("hr_min") else 0
+        duration = (int(match.group("num")) * 60 + minutes) * 60
 
-    Args:
-        text: The text to check.
+    speed = None
+    if "speed" in first:
+        speed = max(1, round(float(first["speed"].group("speed"))))
 
-    Returns:
-        True if Varoma temperature is referenced.
-    """
-    return bool(re.search(r"\bvaroma\b", text.lower()))
+    return temperature, duration, speed, "varoma" in first
 
 
 def _build_tts_annotation_from_step(
@@ -179,71 +206,142 @@ def _build_tts_annotation_from_step(
 _QTY_START = r"[\d¼½¾⅓⅔][\d/.,¼½¾⅓⅔]*\s*"
 
 
+# Initial letters taking the elided "l'" article in French
+_FR_ELISION_INITIALS = frozenset("aeiouyàâéèêëïîôùûüh")
+
+
 def _french_article(name: str) -> str:
     """Return the French article + lowercased name."""
-    low = name[0].lower() + name[1:] if name else name
-    vowels = "aeiouyàâéèêëïîôùûüh"
-    if low and low[0] in vowels:
+    low = name[0].lower() + name[1:] if name and not name[0].islower() else name
+    if low[:1] in _FR_ELISION_INITIALS:
         return "l'" + low
     return "le " + low
 
 
+@lru_cache(maxsize=64)
+def _quantity_pattern(names: tuple[str, ...]) -> re.Pattern:
+    """Compile one pattern matching a quantity before any of the names.
+
+    Matches "qty unit de/d' name" or "qty name". Each name is its own
+    capturing group (group i + 1 for names[i]), tried in order. The unit and
+    article prefix is repeated in every alternative so that each name
+    backtracks on its own: "1 feuilles de laurier" must match the name
+    "feuilles de laurier" before "laurier" with a "feuilles" unit. Cached per
+    name tuple, so previewing then importing a recipe compiles it once.
+    """
+    prefix = r"(?:" + UNITS_PATTERN + r")?\s*(?:de\s+|d['']\s*)?"
+    alternatives = "|".join(f"{prefix}({re.escape(name)})" for name in names)
+    return re.compile(_QTY_START + r"(?:" + alternatives + r")", re.IGNORECASE)
+
+
+def _build_quantity_matcher(
+    ingredients: list["Ingredient"], locale: str = "fr"
+) -> tuple[re.Pattern, tuple[str, ...]] | None:
+    """Prepare the quantity pattern and article replacements of a recipe.
+
+    Names are sorted by length (longest first) to avoid partial matches.
+    Built once per recipe, then applied to every step.
+
+    Returns:
+        The pattern and the replacement for each of its groups, or None if
+        no ingredient has a name.
+    """
+    is_fr = locale.startswith("fr")
+    names = []
+    replacements = []
+    for ing in sorted(ingredients, key=lambda i: len(i.name), reverse=True):
+        if not ing.name:
+            continue
+        if is_fr:
+            replacement = _french_article(ing.name)
+        else:
+            replacement = ing.name
+            if not replacement[0].islower():
+                replacement = replacement[0].lower() + replacement[1:]
+        names.append(ing.name)
+        replacements.append(replacement)
+    if not names:
+        return None
+    return _quantity_pattern(tuple(names)), tuple(replacements)
+
+
 def _strip_ingredient_quantities(
-    text: str, ingredients: list["Ingredient"], locale: str = "fr"
+    text: str, matcher: tuple[re.Pattern, tuple[str, ...]] | None
 ) -> str:
     """Replace ingredient quantities in step text with articles.
 
     Transforms '200 grammes de boulgour' into 'le boulgour',
     '20 grammes d'huile d'olive' into "l'huile d'olive", etc.
+
+    Args:
+        text: The step description.
+        matcher: Output of _build_quantity_matcher for the recipe.
     """
-    # Sort by name length (longest first) to avoid partial matches
-    sorted_ings = sorted(ingredients, key=lambda i: len(i.name), reverse=True)
+    if matcher is None:
+        return text
+    pattern, replacements = matcher
+    return pattern.sub(lambda match: replacements[match.lastindex - 1], text)
 
-    for ing in sorted_ings:
-        if not ing.name:
-            continue
-        name_escaped = re.escape(ing.name)
-        # Match: "qty unit de/d' name" or "qty name"
-        pattern = (
-            _QTY_START
-            + r"(?:" + UNITS_PATTERN + r")?\s*"
-            + r"(?:de\s+|d['']\s*)?"
-            + name_escaped
-        )
-        if locale.startswith("fr"):
-            replacement = _french_article(ing.name)
-        else:
-            low = ing.name[0].lower() + ing.name[1:]
-            replacement = low
-        text = re.sub(pattern, replacement, text, flags=re.IGNORECASE)
 
-    return text
+def _build_ingredient_automaton(
+    ingredients: list["Ingredient"],
+) -> ahocorasick.Automaton | None:
+    """Index the lowercased ingredient names of a recipe for mention lookup.
+
+    Args:
+        ingredients: The list of recipe ingredients.
+
+    Returns:
+        An automaton mapping each name to the indexes of the ingredients
+        bearing it, or None if no ingredient has a name.
+    """
+    indexes: dict[str, list[int]] = {}
+    for i, ingredient in enumerate(ingredients):
+        if ingredient.name:
+            indexes.setdefault(ingredient.name.lower(), []).append(i)
+    if not indexes:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for name, positions in indexes.items():
+        automaton.add_word(name, (len(name), tuple(positions)))
+    automaton.make_automaton()
+    return automaton
 
 
 def _find_ingredient_mentions(
-    step_text: str, ingredients: list["Ingredient"]
+    step_text: str,
+    ingredients: list["Ingredient"],
+    automaton: ahocorasick.Automaton | None,
 ) -> list[IngredientAnnotation]:
     """Find ingredient mentions in step text and create annotations.
 
     Args:
         step_text: The step description text.
         ingredients: The list of recipe ingredients.
+        automaton: The recipe's ingredient automaton, from
+            _build_ingredient_automaton.
 
     Returns:
-        A list of IngredientAnnotation for each found ingredient.
+        A list of IngredientAnnotation, one per found ingredient (first
+        mention), in ingredient order.
     """
-    annotations = []
-    text_lower = step_text.lower()
+    # One pass over the step finds every name; keep the first mention of each
+    offsets: dict[int, int] = {}
+    if automaton is not None:
+        for end, (length, positions) in automaton.iter(step_text.lower()):
+            for i in positions:
+                offsets.setdefault(i, end - length + 1)
 
-    for ingredient in ingredients:
-        name_lower = ingredient.name.lower()
-        # Search for ingredient name in the step text
-        idx = text_lower.find(name_lower)
-        if idx != -1:
+    annotations = []
+    for i, ingredient in enumerate(ingredients):
+        # An empty name "matches" at the start of the text
+        offset = offsets.get(i) if ingredient.name else 0
+        if offset is not None:
             annotations.append(
                 IngredientAnnotation(
                     position=AnnotationPosition(
-                        offset=idx, length=len(ingredient.name)
+                        offset=offset, length=len(ingredient.name)
                     ),
                     ingredient=ingredient,
                 )
@@ -252,15 +350,44 @@ def _find_ingredient_mentions(
     return annotations
 
 
-def convert_step(step_text: str, locale: str = "fr") -> ThermomixStep:
-    """Convert a standard cooking step into a Thermomix step.
+def _match_keywords(text: str) -> dict[str, object]:
+    """Find the keywords present in a normalized text in a single pass.
 
     Args:
-        step_text: The original step description.
-        locale: Language code for TTS formatting ("fr" or "en").
+        text: Lowercased, accent-stripped text.
 
     Returns:
-        A ThermomixStep with speed, temperature, duration, etc.
+        A dict {category: value} holding, for each matched category
+        ("turbo", "cooking", "mixing", "tool"), the value of its
+        highest-priority (first declared) keyword.
+    """
+    best: dict[str, tuple[int, object]] = {}
+    for _, entries in KEYWORD_AUTOMATON.iter(text):
+        for category, rank, value in entries:
+            if category not in best or rank < best[category][0]:
+                best[category] = (rank, value)
+    return {category: value for category, (_, value) in best.items()}
+
+
+class _StepFields(NamedTuple):
+    """Immutable ThermomixStep fields derived from a step text (cacheable)."""
+
+    description: str
+    duration_seconds: int | None
+    temperature: int | None
+    speed: int | None
+    reverse: bool
+    is_turbo: bool
+    is_varoma: bool
+
+
+@lru_cache(maxsize=2048)
+def _parse_step_fields(step_text: str) -> _StepFields:
+    """Derive the cooking parameters and clean description of a step.
+
+    Cached per step text: boilerplate steps such as "Saler, poivrer" recur
+    across recipes. Only an immutable tuple is cached; every caller builds
+    its own ThermomixStep from it.
     """
     text_normalized = _strip_accents(step_text.lower())
 
@@ -269,51 +396,39 @@ def convert_step(step_text: str, locale: str = "fr") -> ThermomixStep:
     duration = None
     reverse = False
     is_turbo = False
-    is_varoma = _is_varoma_temperature(step_text)
-
-    # Check turbo keywords
-    for kw in TURBO_KEYWORDS:
-        if kw in text_normalized:
-            is_turbo = True
-            duration = 15
-            break
-
-    if not is_turbo:
-        # Check cooking keywords (high priority)
-        for keyword, params in COOKING_KEYWORDS.items():
-            if keyword in text_normalized:
-                speed = params.get("speed", 1)
-                temperature = params.get("temp")
-                reverse = params.get("reverse", False)
-                duration = params.get("duration")
-                if params.get("varoma"):
-                    is_varoma = True
-                break
-
-        # Check mixing keywords
-        if speed is None:
-            for keyword, params in MIXING_KEYWORDS.items():
-                if keyword in text_normalized:
-                    speed = params.get("speed", 3)
-                    duration = params.get("duration", 30)
-                    reverse = params.get("reverse", False)
-                    break
+    text_temp, text_duration, text_speed, is_varoma = _parse_step_params(step_text)
+
+    matched = _match_keywords(text_normalized)
+
+    if "turbo" in matched:
+        is_turbo = True
+        duration = 15
+    elif "cooking" in matched:
+        # Cooking keywords have priority over mixing keywords
+        params = matched["cooking"]
+        speed = params.get("speed", 1)
+        temperature = params.get("temp")
+        reverse = params.get("reverse", False)
+        duration = params.get("duration")
+        if params.get("varoma"):
+            is_varoma = True
+    elif "mixing" in matched:
+        params = matched["mixing"]
+        speed = params.get("speed", 3)
+        duration = params.get("duration", 30)
+        reverse = params.get("reverse", False)
 
     # Override with explicit values found in text
-    if not is_varoma:
-        text_temp = _parse_temperature_from_text(step_text)
-        if text_temp:
-            temperature = text_temp
+    if not is_varoma and text_temp:
+        temperature = text_temp
 
-    text_duration = _parse_duration_from_text(step_text)
     if text_duration:
         duration = text_duration
 
-    text_speed = _parse_speed_from_text(step_text)
     if text_speed is not None:
         speed = text_speed
 
-    step = ThermomixStep(
+    return _StepFields(
         description=_clean_description(step_text),
         duration_seconds=duration,
         temperature=temperature,
@@ -323,10 +438,23 @@ def convert_step(step_text: str, locale: str = "fr") -> ThermomixStep:
         is_varoma=is_varoma,
     )
 
+
+def convert_step(step_text: str, locale: str = "fr") -> ThermomixStep:
+    """Convert a standard cooking step into a Thermomix step.
+
+    Args:
+        step_text: The original step description.
+        locale: Language code for TTS formatting ("fr" or "en").
+
+    Returns:
+        A ThermomixStep with speed, temperature, duration, etc.
+    """
+    step = ThermomixStep(**_parse_step_fields(step_text)._asdict())
+
     # Build TTS annotation from detected parameters
     tts = _build_tts_annotation_from_step(step, locale)
     if tts:
-        step.tts_annotations = [tts]
+        step = step.model_copy(update={"tts_annotations": [tts]})
 
     return step
 
@@ -345,6 +473,35 @@ def _normalize_unit(unit: str | None) -> str | None:
     return UNIT_MAP.get(unit.lower(), unit)
 
 
+_FRACTION_VALUES = [value for value, _ in FRACTION_TABLE]
+
+# Exact hits on the common spellings (0.5, 0.25, 0.33, 0.67...)
+_FRACTION_BY_ROUNDED = {round(value, 2): glyph for value, glyph in FRACTION_TABLE}
+
+
+def _format_fraction(value: float, tolerance: float = 0.02) -> str | None:
+    """Return the fraction glyph for a decimal part (e.g. 0.5 -> "½").
+
+    Args:
+        value: The decimal part, between 0 and 1.
+        tolerance: Maximum distance to a known fraction (absorbs 0.33, 0.666...).
+
+    Returns:
+        The closest fraction glyph, or None if none is within tolerance.
+    """
+    glyph = _FRACTION_BY_ROUNDED.get(round(value, 2))
+    if glyph is not None or not value:
+        return glyph
+    idx = bisect_left(_FRACTION_VALUES, value)
+    # Only the neighbours around the insertion point can be the closest
+    for candidate in (idx - 1, idx):
+        if 0 <= candidate < len(FRACTION_TABLE):
+            fraction_value, glyph = FRACTION_TABLE[candidate]
+            if abs(value - fraction_value) < tolerance:
+                return glyph
+    return None
+
+
 def _normalize_quantity(qty: str | None) -> str | None:
     """Convert decimal quantities to fractions where appropriate.
 
@@ -352,29 +509,21 @@ def _normalize_quantity(qty: str | None) -> str | None:
         qty: The raw quantity string (e.g. "0.75").
 
     Returns:
-        A human-readable quantity (e.g. "¾").
+        A human-readable quantity (e.g. "¾", or "1 ½" for "1.5").
     """
     if qty is None:
         return None
     qty = qty.strip()
 
-    # Direct match (e.g. "0.5" -> "½")
-    if qty in FRACTION_MAP:
-        return FRACTION_MAP[qty]
-
-    # Mixed number (e.g. "1.5" -> "1 ½")
     try:
         val = float(qty.replace(",", "."))
-        whole = int(val)
-        decimal = round(val - whole, 2)
-        decimal_str = f"{decimal:.2g}"
-        if decimal > 0 and decimal_str in FRACTION_MAP:
-            if whole > 0:
-                return f"{whole} {FRACTION_MAP[decimal_str]}"
-            return FRACTION_MAP[decimal_str]
     except ValueError:
-        pass
+        return qty
 
+    whole = int(val)
+    fraction = _format_fraction(val - whole)
+    if fraction:
+        return f"{whole} {fraction}" if whole > 0 else fraction
     return qty
 
 
@@ -399,6 +548,16 @@ def _parse_numeric_quantity(raw_qty: str | None) -> float | None:
         return None
 
 
+# Either "Name - quantity unit" (e.g. "Oignon blanc - 1", "Huile d'olive - 20
+# grammes") or "quantity unit name" (e.g. "200 g de farine", "1 cup flour"),
+# tried in that order in a single match
+_INGREDIENT_RE = re.compile(
+    rf"^(?:(?P<n1>.+?)\s*[-–]\s*(?P<q1>[\d/.,]+)\s*(?P<u1>{UNITS_PATTERN})?\s*$"
+    rf"|(?P<q2>[\d/.,]+)\s*(?P<u2>{UNITS_PATTERN})?\s*(?:de\s+|d['']|of\s+)?\s*(?P<n2>.+)$)",
+    re.IGNORECASE,
+)
+
+
 def parse_ingredient(raw: str) -> Ingredient:
     """Parse a raw ingredient string into a structured Ingredient.
 
@@ -410,37 +569,22 @@ def parse_ingredient(raw: str) -> Ingredient:
     """
     text = raw.strip()
 
-    # Format "Name - quantity unit" (e.g. "Oignon blanc - 1", "Huile d'olive - 20 grammes")
-    match = re.match(
-        rf"^(.+?)\s*[-–]\s*([\d/.,]+)\s*({UNITS_PATTERN})?\s*$",
-        text,
-        re.IGNORECASE,
+    match = _INGREDIENT_RE.match(text)
+    if match is None:
+        return Ingredient(name=text)
+
+    if match.group("q1") is not None:
+        # Format "Name - quantity unit"
+        name, raw_qty, unit = match.group("n1", "q1", "u1")
+    else:
+        # Format "quantity unit name"
+        name, raw_qty, unit = match.group("n2", "q2", "u2")
+    return Ingredient(
+        name=name.strip(),
+        quantity=_normalize_quantity(raw_qty),
+        unit=_normalize_unit(unit),
+        quantity_numeric=_parse_numeric_quantity(raw_qty),
     )
-    if match:
-        raw_qty = match.group(2)
-        return Ingredient(
-            name=match.group(1).strip(),
-            quantity=_normalize_quantity(raw_qty),
-            unit=_normalize_unit(match.group(3)),
-            quantity_numeric=_parse_numeric_quantity(raw_qty),
-        )
-
-    # Format "quantity unit name" (e.g. "200 g de farine", "3 oeufs", "1 cup flour")
-    match = re.match(
-        rf"^([\d/.,]+)\s*({UNITS_PATTERN})?\s*(?:de\s+|d['']|of\s+)?\s*(.+)$",
-        text,
-        re.IGNORECASE,
-    )
-    if match:
-        raw_qty = match.group(1)
-        return Ingredient(
-            quantity=_normalize_quantity(raw_qty),
-            unit=_normalize_unit(match.group(2)),
-            name=match.group(3).strip(),
-            quantity_numeric=_parse_numeric_quantity(raw_qty),
-        )
-
-    return Ingredient(name=text)
 
 
 def _detect_tools(instructions: list[str]) -> list[str]:
@@ -452,14 +596,18 @@ def _detect_tools(instructions: list[str]) -> list[str]:
     Returns:
         A list of tool names (always includes TM7).
     """
-    tools = ["TM7"]
-    text = _strip_accents(" ".join(instructions).lower())
-
-    for tool_name, keywords in TOOL_KEYWORDS.items():
-        if any(kw in text for kw in keywords):
-            tools.append(tool_name)
-
-    return tools
+    # (rank, tool) pairs: sorting restores the TOOL_KEYWORDS declaration order
+    found: set[tuple[int, str]] = set()
+    # One instruction at a time, stopping as soon as every tool is found
+    for instruction in instructions:
+        text = _strip_accents(instruction.lower())
+        for _, entries in KEYWORD_AUTOMATON.iter(text):
+            for category, rank, tool_name in entries:
+                if category == "tool":
+                    found.add((rank, tool_name))
+        if len(found) == len(TOOL_KEYWORDS):
+            break
+    return ["TM7"] + [tool_name for _, tool_name in sorted(found)]
 
 
 def convert_recipe(scraped: ScrapedRecipe, locale: str = "fr") -> ThermomixRecipe:
@@ -473,16 +621,23 @@ def convert_recipe(scraped: ScrapedRecipe, locale: str = "fr") -> ThermomixRecip
         A ThermomixRecipe ready for Cookidoo upload.
     """
     ingredients = [parse_ingredient(ing) for ing in scraped.ingredients]
-    steps = [convert_step(step, locale) for step in scraped.instructions]
+    ingredient_automaton = _build_ingredient_automaton(ingredients)
+    quantity_matcher = _build_quantity_matcher(ingredients, locale)
 
     # Strip ingredient quantities from step descriptions and link annotations
-    for step in steps:
-        step.description = _strip_ingredient_quantities(
-            step.description, ingredients, locale
-        )
+    steps = []
+    for raw_step in scraped.instructions:
+        step = convert_step(raw_step, locale)
+        step = step.model_copy(update={
+            "description": _strip_ingredient_quantities(
+                step.description, quantity_matcher
+            ),
+        })
         step_text = step.to_text(locale)
-        ing_annotations = _find_ingredient_mentions(step_text, ingredients)
-        step.ingredient_annotations = ing_annotations
+        ing_annotations = _find_ingredient_mentions(
+            step_text, ingredients, ingredient_automaton
+        )
+        steps.append(step.with_ingredient_annotations(ing_annotations))
 
     hints = []
     if scraped.source_url: